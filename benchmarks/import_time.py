@@ -0,0 +1,61 @@
+"""
+Import time benchmark for the acquisition package.
+
+Every case runs in a fresh interpreter, so the numbers include the full import
+cost a user pays when starting a script, calling -h or importing a helper from
+a notebook or batch analysis script.
+
+Usage:
+    python3 benchmarks/import_time.py --repeats=10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'python startup': ['-c', 'pass'],
+    'import hmp_pico_daq': ['-c', 'import hmp_pico_daq'],
+    'import hmp_4_channel_monitoring': ['-c', 'import hmp_pico_daq.hmp_4_channel_monitoring'],
+    'import pico_waveforms_with_threshhold': ['-c', 'import hmp_pico_daq.pico_waveforms_with_threshhold'],
+    'hmp_4_channel_monitoring -h': ['-m', 'hmp_pico_daq.hmp_4_channel_monitoring', '-h'],
+    'pico_waveforms_with_threshhold -h': ['-m', 'hmp_pico_daq.pico_waveforms_with_threshhold', '-h'],
+}
+
+
+def time_case(arguments, repeats):
+    """Run the interpreter with the given arguments and time each run.
+
+    Args:
+        arguments (list): Arguments passed to the python interpreter
+        repeats (int): Number of timed runs
+
+    Returns:
+        list: Wall clock time of each run in ms
+    """
+    timings_ms = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *arguments], cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings_ms.append((time.perf_counter() - start) * 1000)
+    return timings_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the start up time of the acquisition package in fresh interpreters.')
+    parser.add_argument('--repeats', type=int, default=10, help='Number of timed runs per case (integer). Default: 10')
+    args = parser.parse_args()
+
+    print(f"{'case':<40}{'median ms':>12}{'min ms':>12}")
+    for name, arguments in CASES.items():
+        timings_ms = time_case(arguments, args.repeats)
+        print(f'{name:<40}{statistics.median(timings_ms):>12.1f}{min(timings_ms):>12.1f}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Reusable parts of the HMP4040 and PicoScope data acquisition scripts.
+
+Importing the package is cheap: the submodules and their heavy dependencies
+(pymeasure, pyvisa, picosdk, matplotlib, pandas, h5py) are only loaded when
+one of the names below is first accessed, e.g.
+
+    from hmp_pico_daq import get_waveform_data
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'handle_file': 'hmp_pico_daq.file_handling',
+    'connect_to_device': 'hmp_pico_daq.hmp_4_channel_monitoring',
+    'load_data_into_dataframe': 'hmp_pico_daq.hmp_4_channel_monitoring',
+    'save_waveform_data': 'hmp_pico_daq.pico_waveforms_with_threshhold',
+    'get_waveform_data': 'hmp_pico_daq.pico_waveforms_with_threshhold',
+    'plot_waveforms': 'hmp_pico_daq.pico_waveforms_with_threshhold',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access.
+
+    Args:
+        name (str): Attribute requested from the package
+
+    Returns:
+        object: The function exported by the owning submodule
+    """
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names alongside the loaded ones."""
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,44 @@
+"""
+Shared log file handling for the HMP4040 and PicoScope acquisition scripts.
+
+Only depends on the standard library, so importing it never pulls in the
+instrument drivers or the plotting stack.
+"""
+
+import os
+
+MAX_FILE_NAME_INPUT_ATTEMPTS = 2
+
+def handle_file(file_address, attempts=0): # human readable & some formatting
+
+    """
+    Handles file creation and existing file scenarios, with a limit of 2 attempts.
+
+    Args:
+        file_address (str): The file path and name for the new or existing file
+        attempts (int): The number of attempts made so far to handle the file
+
+    Returns:
+        str: File address or exits the program
+    """
+
+    if attempts >= MAX_FILE_NAME_INPUT_ATTEMPTS:
+        print("Maximum number of attempts reached. Exiting program.")
+        exit()
+
+    if not os.path.exists(file_address):
+        with open(file_address, "w") as file:
+            pass
+        return file_address
+
+    else:
+        choice = input(f"The file '{file_address}' already exists. Delete it (D) or specify a new location and name (N)? Enter 'D' or 'N': ").upper()
+        if choice == 'D':
+            os.remove(file_address)
+            return handle_file(file_address)
+        elif choice == 'N':
+            print('Please restart and provide a valid file_path & file_name')
+            exit()
+        else:
+            print("Invalid input. Please enter 'D' or 'N'.")
+            return handle_file(file_address, attempts + 1)